@@ -3,6 +3,7 @@ Django admin configuration for ecommerce models.
 """
 from django.contrib import admin
 from .models import Store, Product, Review
+from .paginators import LargeTablePaginator
 
 
 @admin.register(Store)
@@ -12,6 +13,10 @@ class StoreAdmin(admin.ModelAdmin):
     list_filter = ['created_at', 'vendor']
     search_fields = ['name', 'description', 'vendor__username']
     readonly_fields = ['created_at']
+    list_select_related = ['vendor']
+    raw_id_fields = ['vendor']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
 
 
 @admin.register(Product)
@@ -21,6 +26,14 @@ class ProductAdmin(admin.ModelAdmin):
     list_filter = ['created_at', 'store']
     search_fields = ['name', 'description', 'store__name']
     readonly_fields = ['created_at']
+    list_select_related = ['store', 'store__vendor']
+    autocomplete_fields = ['store']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Join the store and vendor used by __str__ and search lookups."""
+        return super().get_queryset(request).select_related('store__vendor')
 
 
 @admin.register(Review)
@@ -30,5 +43,13 @@ class ReviewAdmin(admin.ModelAdmin):
     list_filter = ['rating', 'created_at']
     search_fields = ['product__name', 'user__username', 'comment']
     readonly_fields = ['created_at']
+    list_select_related = ['product', 'product__store', 'user']
+    autocomplete_fields = ['product', 'user']
+    paginator = LargeTablePaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Join the product, store and user used by __str__ and search lookups."""
+        return super().get_queryset(request).select_related('product__store__vendor', 'user')
 
 
@@ -10,12 +10,7 @@ class EcommerceConfig(AppConfig):
     name = 'ecommerce'
 
     def ready(self):
-        """
-        Initialize Tweet singleton when app is ready.
-        This ensures the Twitter API connection is established at startup.
-        """
-        from .functions.tweet import Tweet
-        # Initialize singleton instance
-        Tweet()
+        """Connect signal receivers that invalidate cached catalog responses."""
+        from . import signals  # noqa: F401
 
 
@@ -0,0 +1,90 @@
+"""
+Authentication classes for the ecommerce API.
+"""
+import threading
+import time
+from collections import OrderedDict
+from django.contrib.auth import get_user_model
+from django.utils.crypto import salted_hmac
+from rest_framework.authentication import BasicAuthentication
+from rest_framework.permissions import SAFE_METHODS
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    Basic authentication that remembers verified credentials briefly.
+    
+    Password hashing (PBKDF2) costs tens of milliseconds per request, so
+    successful credentials are kept in a small in-process LRU for CACHE_TTL
+    seconds. Entries are keyed by a salted HMAC of the credentials, never the
+    password itself, and the user row is re-read on every hit together with
+    the password hash that was verified, so deactivated or renamed users and
+    changed passwords are rejected immediately.
+    """
+    CACHE_TTL = 60
+    CACHE_MAXSIZE = 1024
+    _verified = OrderedDict()
+    _lock = threading.Lock()
+
+    def authenticate_credentials(self, userid, password, request=None):
+        """
+        Authenticate the userid and password, reusing a recent verification.
+        
+        Args:
+            userid: Username from the Authorization header
+            password: Password from the Authorization header
+            request: Incoming request
+        
+        Returns:
+            tuple: (user, None)
+        
+        Raises:
+            AuthenticationFailed: If the credentials are invalid
+        """
+        key = salted_hmac("ecommerce.authentication.CachedBasicAuthentication", f"{userid}\0{password}").hexdigest()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._verified.get(key)
+            if entry is not None and entry[2] <= now:
+                del self._verified[key]
+                entry = None
+
+        if entry is not None:
+            user_pk, password_hash, _ = entry
+            user_model = get_user_model()
+            user = user_model._default_manager.filter(
+                pk=user_pk, password=password_hash, is_active=True, **{user_model.USERNAME_FIELD: userid}
+            ).first()
+            if user is not None:
+                return (user, None)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        with self._lock:
+            self._verified[key] = (user.pk, user.password, now + self.CACHE_TTL)
+            self._verified.move_to_end(key)
+            while len(self._verified) > self.CACHE_MAXSIZE:
+                self._verified.popitem(last=False)
+        return (user, auth)
+
+
+class WriteBasicAuthentication(CachedBasicAuthentication):
+    """
+    Basic authentication that only runs for unsafe (write) methods.
+    
+    Used on endpoints whose GET is public, so read requests that happen to
+    carry an Authorization header skip password verification entirely.
+    """
+
+    def authenticate(self, request):
+        """
+        Authenticate write requests; treat safe methods as anonymous.
+        
+        Args:
+            request: Incoming request
+        
+        Returns:
+            tuple: (user, None) if authenticated, None otherwise
+        """
+        if request.method in SAFE_METHODS:
+            return None
+        return super().authenticate(request)
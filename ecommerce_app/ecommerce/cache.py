@@ -0,0 +1,112 @@
+"""
+Versioned caching for public catalog (store and product) responses.
+
+Cached entries are keyed on a catalog version number that is bumped whenever
+a store, product or vendor change is committed, so stale entries are never
+read again and simply expire.
+
+The version only works when every worker reads it from the same cache, so
+caching and ETags are off unless CATALOG_CACHE_ENABLED is set; it defaults to
+on for shared backends only.
+"""
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+CATALOG_VERSION_KEY = 'ecommerce:catalog:version'
+
+
+def get_catalog_version():
+    """
+    Get the current catalog version.
+    
+    Starts from the current time in milliseconds so a version key evicted
+    from the cache never falls back to a version with entries still cached.
+    
+    Returns:
+        int: Current catalog version
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """
+    Invalidate all cached catalog responses.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        get_catalog_version()
+
+
+def get_cached_catalog_data(prefix, request, build):
+    """
+    Return cached response data for a catalog request, building it on a miss.
+    
+    Args:
+        prefix (str): Cache key prefix naming the endpoint
+        request: Incoming request; its host and full path are hashed into the key
+        build (callable): Returns the serialized response data
+    
+    Returns:
+        Serialized response data
+    """
+    if not settings.CATALOG_CACHE_ENABLED:
+        return build()
+    # Hash the client-controlled parts so the key stays short enough for Memcached
+    variant = f"{request.get_host()}|{request.get_full_path()}"
+    digest = hashlib.md5(variant.encode(), usedforsecurity=False).hexdigest()
+    key = f"ecommerce:{prefix}:v{get_catalog_version()}:{digest}"
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, settings.CATALOG_CACHE_TIMEOUT)
+    return data
+
+
+def catalog_etag(request, *args, **kwargs):
+    """
+    Compute the ETag of a catalog response.
+    
+    Combines the catalog version with the path and Accept header, so JSON and
+    XML representations get different ETags. Only reads carry an ETag, so
+    creates on the same endpoints skip the version lookup and are never
+    subject to If-Match/If-None-Match preconditions.
+    
+    Args:
+        request: Incoming request
+    
+    Returns:
+        str: ETag value, or None for writes or when catalog caching is disabled
+    """
+    if request.method not in ('GET', 'HEAD') or not settings.CATALOG_CACHE_ENABLED:
+        return None
+    variant = f"{request.get_full_path()}|{request.headers.get('Accept', '')}"
+    digest = hashlib.md5(variant.encode(), usedforsecurity=False).hexdigest()[:16]
+    return f"{get_catalog_version()}-{digest}"
+
+
+def add_catalog_cache_headers(response):
+    """
+    Mark a catalog response as publicly cacheable.
+    
+    Args:
+        response: Response to update
+    
+    Returns:
+        The same response
+    """
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.CATALOG_CACHE_MAX_AGE,
+        stale_while_revalidate=settings.CATALOG_CACHE_STALE_WHILE_REVALIDATE
+    )
+    patch_vary_headers(response, ['Accept'])
+    return response
@@ -0,0 +1,99 @@
+"""
+View decorators for ecommerce API endpoints.
+"""
+from functools import wraps
+from operator import attrgetter
+from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated, NotFound, PermissionDenied
+from rest_framework.response import Response
+from .models import Store, Product
+
+
+def require_owner(queryset, lookup, vendor_lookup, noun, actions):
+    """
+    Load an object from the URL and enforce vendor ownership per method.
+    
+    The view receives the loaded object in place of the URL keyword. For
+    methods listed in actions the user must be authenticated and own the
+    object; ownership compares vendor IDs, so no User row is loaded.
+    Missing objects and failed checks raise NotFound ('Store not found'
+    and the like), NotAuthenticated or PermissionDenied for DRF's
+    exception handler.
+    
+    A DELETE listed in actions never reaches the view: the object is deleted
+    with a single owner-filtered query and 204 is returned, so the happy
+    path loads nothing up front.
+    
+    Args:
+        queryset: Queryset the object is loaded from
+        lookup (str): URL keyword holding the primary key
+        vendor_lookup (str): Query lookup of the owning vendor's ID,
+            e.g. 'store__vendor_id'
+        noun (str): Object name used in error messages
+        actions (dict): Maps HTTP methods requiring ownership to the action
+            named in the 403 message, e.g. {'PUT': 'update'}
+    
+    Returns:
+        callable: View decorator
+    """
+    get_vendor_id = attrgetter(vendor_lookup.replace('__', '.'))
+    not_found = f'{noun.capitalize()} not found'
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            pk = kwargs.pop(lookup)
+            action = actions.get(request.method)
+            if action is not None and not request.user.is_authenticated:
+                raise NotAuthenticated('Authentication required')
+
+            if action is not None and request.method == 'DELETE':
+                deleted, _ = queryset.filter(pk=pk, **{vendor_lookup: request.user.id}).delete()
+                if deleted:
+                    return Response(status=status.HTTP_204_NO_CONTENT)
+                # Nothing matched: tell a missing object from someone else's
+                if not queryset.filter(pk=pk).exists():
+                    raise NotFound(not_found)
+                raise PermissionDenied(f'You do not have permission to {action} this {noun}')
+
+            obj = queryset.filter(pk=pk).first()
+            if obj is None:
+                raise NotFound(not_found)
+            if action is not None and get_vendor_id(obj) != request.user.id:
+                raise PermissionDenied(f'You do not have permission to {action} this {noun}')
+            return view(request, obj, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def require_store_owner(actions, fields=None):
+    """
+    Load the store named by store_id and enforce ownership for actions.
+    
+    Without fields the vendor is joined in, since the full store
+    representation nests it.
+    
+    Args:
+        actions (dict): Maps HTTP methods to the action named in the 403 message
+        fields (tuple, optional): Columns to load when the view needs only some
+    
+    Returns:
+        callable: View decorator
+    """
+    queryset = Store.objects.only(*fields) if fields else Store.objects.select_related('vendor')
+    return require_owner(queryset, 'store_id', 'vendor_id', 'store', actions)
+
+
+def require_product_owner(actions):
+    """
+    Load the product named by product_id and enforce ownership for actions.
+    
+    Args:
+        actions (dict): Maps HTTP methods to the action named in the 403 message
+    
+    Returns:
+        callable: View decorator
+    """
+    return require_owner(
+        Product.objects.select_related('store__vendor'), 'product_id', 'store__vendor_id', 'product', actions
+    )
@@ -0,0 +1,63 @@
+"""
+Exception handling for ecommerce API endpoints.
+"""
+import json
+from functools import lru_cache
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import exception_handler
+
+
+@lru_cache(maxsize=256)
+def _error_bytes(message):
+    """
+    Render an error body as JSON bytes, once per distinct message.
+    
+    Matches JSONRenderer's compact output.
+    
+    Args:
+        message (str): Error message
+    
+    Returns:
+        bytes: Encoded {'error': message} body
+    """
+    return json.dumps({'error': message}, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def api_exception_handler(exc, context):
+    """
+    Render API exceptions as {'error': message} responses.
+    
+    Delegates to DRF's handler for Http404, PermissionDenied and other API
+    exceptions, renaming its 'detail' key to the 'error' key the API has
+    always returned. When the client negotiated JSON, the body is served
+    from pre-encoded bytes instead of going through the renderer; XML
+    clients keep the regular Response. Unexpected exceptions return None,
+    so DRF re-raises them and Django's 500 handling (error reporting, the
+    DEBUG traceback page) takes over.
+    
+    Args:
+        exc: Exception raised by the view
+        context (dict): Handler context including the view and request
+    
+    Returns:
+        HttpResponse: Error response, or None for non-API exceptions
+    """
+    request = context.get('request')
+    response = exception_handler(exc, context)
+    if response is None:
+        return None
+
+    if not (isinstance(response.data, dict) and set(response.data) == {'detail'}):
+        return response
+
+    message = str(response.data['detail'])
+    if isinstance(getattr(request, 'accepted_renderer', None), JSONRenderer):
+        static = HttpResponse(_error_bytes(message), status=response.status_code, content_type='application/json')
+        for header, value in response.items():
+            if header.lower() != 'content-type':
+                static[header] = value
+        return static
+
+    response.data = {'error': message}
+    return response
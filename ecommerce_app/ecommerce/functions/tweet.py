@@ -2,12 +2,54 @@
 Twitter/X API integration using Singleton pattern.
 """
 import logging
-from requests_oauthlib import OAuth1Session
+import queue
+import threading
+import time
+import httpx
+from authlib.oauth1 import ClientAuth
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
 
+class OAuth1Auth(httpx.Auth):
+    """
+    httpx authentication flow signing each request with OAuth1.
+    
+    Wraps Authlib's framework-independent ClientAuth signer, since its
+    httpx integration is deprecated.
+    """
+    requires_request_body = True
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create the signer.
+        
+        Args:
+            *args: Positional arguments for authlib.oauth1.ClientAuth
+            **kwargs: Keyword arguments for authlib.oauth1.ClientAuth
+        """
+        self.signer = ClientAuth(*args, **kwargs)
+
+    def auth_flow(self, request):
+        """
+        Sign the request and send the signed copy.
+        
+        Args:
+            request (httpx.Request): Outgoing request
+        
+        Yields:
+            httpx.Request: Signed request
+        """
+        url, headers, body = self.signer.prepare(
+            request.method, str(request.url), dict(request.headers), request.content
+        )
+        headers['Content-Length'] = str(len(body))
+        yield httpx.Request(
+            request.method, url, headers=headers, content=body, extensions=request.extensions
+        )
+
+
 class Tweet:
     """
     Singleton class for Twitter/X API integration.
@@ -21,9 +63,21 @@ class Tweet:
         consumer_secret: Twitter API consumer secret
         access_token: Twitter API access token
         access_token_secret: Twitter API access token secret
-        oauth: OAuth1Session instance for making authenticated requests
+        client: HTTP/2 httpx.Client signing requests with OAuth1
+        _lock: Lock serialising requests on the shared connection
+        _queue: Pending tweet payloads waiting to be posted
+        _worker: Daemon thread that drains the queue off the request thread
+        _bucket: Token bucket state per endpoint as (tokens, updated_at)
     """
     _instance = None
+    _instance_lock = threading.Lock()
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 50
+    MAX_RETRIES = 3
+    QUEUE_MAXSIZE = 100
+    FLUSH_INTERVAL = 5
+    RATE_LIMIT_CAPACITY = 50
+    RATE_LIMIT_WINDOW = 15 * 60
     CONSUMER_KEY = None
     CONSUMER_SECRET = None
     ACCESS_TOKEN = None
@@ -37,37 +91,60 @@ class Tweet:
             Tweet: The singleton instance
         """
         if cls._instance is None:
-            cls._instance = super(Tweet, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(Tweet, cls).__new__(cls)
+                    instance._initialized = False
+                    instance._lock = threading.Lock()
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         """
         Initialize the singleton instance with Twitter API credentials.
-        Only initializes once even if called multiple times.
+        Only initializes once even if called multiple times; the first call
+        happens lazily when a view first posts a tweet, so it runs under
+        _instance_lock and is marked done only once the client and worker
+        exist. Concurrent first callers wait instead of seeing a half-built
+        instance.
         """
         if self._initialized:
             return
 
-        # Load credentials from settings
-        self.CONSUMER_KEY = settings.TWITTER_CONSUMER_KEY
-        self.CONSUMER_SECRET = settings.TWITTER_CONSUMER_SECRET
-        self.ACCESS_TOKEN = settings.TWITTER_ACCESS_TOKEN
-        self.ACCESS_TOKEN_SECRET = settings.TWITTER_ACCESS_TOKEN_SECRET
+        with self._instance_lock:
+            if self._initialized:
+                return
 
-        self.oauth = None
-        self._initialized = True
+            # Load credentials from settings
+            self.CONSUMER_KEY = settings.TWITTER_CONSUMER_KEY
+            self.CONSUMER_SECRET = settings.TWITTER_CONSUMER_SECRET
+            self.ACCESS_TOKEN = settings.TWITTER_ACCESS_TOKEN
+            self.ACCESS_TOKEN_SECRET = settings.TWITTER_ACCESS_TOKEN_SECRET
 
-        # Authenticate if credentials are available
-        if self.CONSUMER_KEY and self.CONSUMER_SECRET:
-            self.authenticate()
+            self.client = None
+            self._queue = queue.Queue(maxsize=self.QUEUE_MAXSIZE)
+            self._worker = None
+            self._bucket = {}
+            self._bucket_lock = threading.Lock()
+
+            # Authenticate if credentials are available
+            if self.CONSUMER_KEY and self.CONSUMER_SECRET and self.authenticate():
+                self._worker = threading.Thread(
+                    target=self._drain_queue,
+                    name='tweet-worker',
+                    daemon=True
+                )
+                self._worker.start()
+
+            self._initialized = True
 
     def authenticate(self):
         """
         Authenticate with Twitter API using OAuth1.
         
-        Creates an OAuth1Session instance for making authenticated requests.
-        Handles authentication errors gracefully.
+        Creates an HTTP/2 httpx.Client that signs requests with OAuth1, so
+        tweets are multiplexed over one pooled TLS connection. Handles
+        authentication errors gracefully.
         
         Returns:
             bool: True if authentication successful, False otherwise
@@ -78,22 +155,39 @@ class Tweet:
                 logger.warning("Twitter API credentials not fully configured")
                 return False
 
-            self.oauth = OAuth1Session(
+            # force_include_body keeps the JSON body; by default Authlib
+            # blanks any body that is not form-encoded
+            auth = OAuth1Auth(
                 self.CONSUMER_KEY,
                 client_secret=self.CONSUMER_SECRET,
-                resource_owner_key=self.ACCESS_TOKEN,
-                resource_owner_secret=self.ACCESS_TOKEN_SECRET
+                token=self.ACCESS_TOKEN,
+                token_secret=self.ACCESS_TOKEN_SECRET,
+                force_include_body=True
             )
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=self.MAX_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=self.MAX_CONNECTIONS
+                )
+            )
+            self.client = httpx.Client(auth=auth, transport=transport)
             logger.info("Twitter API authentication successful")
             return True
-        except Exception as e:
+        except ImportError as e:
+            # httpx raises this when HTTP/2 is requested without the h2 package
             logger.error(f"Twitter API authentication failed: {str(e)}")
-            self.oauth = None
+            self.client = None
             return False
 
     def make_tweet(self, tweet_dict):
         """
-        Post a tweet to Twitter/X.
+        Queue a tweet to be posted to Twitter/X in the background.
+        
+        The worker thread posts queued tweets over the shared client and
+        owns the rate-limit budget, so the calling request never waits on
+        the Twitter API.
         
         Args:
             tweet_dict (dict): Dictionary containing tweet data
@@ -101,29 +195,64 @@ class Tweet:
                 - media_ids (list, optional): List of media IDs to attach
         
         Returns:
-            dict: Response from Twitter API if successful, None otherwise
-        
-        Raises:
-            Exception: If authentication is not set up or API call fails
+            bool: True if the tweet was queued, False otherwise
         """
-        if not self.oauth:
+        if not self.client or self._worker is None:
             logger.warning("Twitter API not authenticated. Skipping tweet.")
-            return None
+            return False
 
-        try:
-            url = "https://api.twitter.com/2/tweets"
-            
-            payload = {
-                "text": tweet_dict.get('text', '')
+        payload = {
+            "text": tweet_dict.get('text', '')
+        }
+
+        # Add media if provided
+        if 'media_ids' in tweet_dict:
+            payload['media'] = {
+                "media_ids": tweet_dict['media_ids']
             }
 
-            # Add media if provided
-            if 'media_ids' in tweet_dict:
-                payload['media'] = {
-                    "media_ids": tweet_dict['media_ids']
-                }
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            logger.warning("Tweet queue is full. Skipping tweet.")
+            return False
+        return True
+
+    def _drain_queue(self):
+        """
+        Post queued tweets for the lifetime of the process.
+        
+        Waits FLUSH_INTERVAL seconds at a time while the rate-limit budget
+        is exhausted instead of sending requests that would be rejected.
+        """
+        while True:
+            payload = self._queue.get()
+            try:
+                while not self._acquire('tweets'):
+                    time.sleep(self.FLUSH_INTERVAL)
+                self._post_tweet(payload)
+            except Exception:
+                # Keep the worker alive; a dead worker would drop every later tweet
+                logger.exception("Unexpected error posting queued tweet")
+            finally:
+                self._queue.task_done()
+
+    def _post_tweet(self, payload):
+        """
+        Post a tweet payload to Twitter/X.
+        
+        Args:
+            payload (dict): Request body for the Twitter v2 tweets endpoint
+        
+        Returns:
+            dict: Response from Twitter API if successful, None otherwise
+        """
+        try:
+            url = "https://api.twitter.com/2/tweets"
 
-            response = self.oauth.post(url, json=payload)
+            with self._lock:
+                response = self.client.post(url, json=payload)
+            self._sync_rate_limit('tweets', response.headers)
             
             if response.status_code == 201:
                 logger.info(f"Tweet posted successfully: {response.json()}")
@@ -133,8 +262,57 @@ class Tweet:
                            f"Response: {response.text}")
                 return None
 
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"Error posting tweet: {str(e)}")
             return None
 
+    def _acquire(self, endpoint, cost=1):
+        """
+        Take tokens from the local rate-limit bucket for an endpoint.
+        
+        Tokens refill continuously at RATE_LIMIT_CAPACITY per
+        RATE_LIMIT_WINDOW seconds, matching Twitter's 15 minute windows.
+        
+        Args:
+            endpoint (str): Rate-limit bucket name
+            cost (int): Number of tokens the call consumes
+        
+        Returns:
+            bool: True if the tokens were available, False otherwise
+        """
+        refill_per_sec = self.RATE_LIMIT_CAPACITY / self.RATE_LIMIT_WINDOW
+        with self._bucket_lock:
+            now = time.monotonic()
+            tokens, updated_at = self._bucket.get(
+                endpoint, (self.RATE_LIMIT_CAPACITY, now)
+            )
+            elapsed = max(0.0, now - updated_at)
+            tokens = min(self.RATE_LIMIT_CAPACITY, tokens + elapsed * refill_per_sec)
+            if tokens < cost:
+                self._bucket[endpoint] = (tokens, max(now, updated_at))
+                return False
+            self._bucket[endpoint] = (tokens - cost, max(now, updated_at))
+            return True
+
+    def _sync_rate_limit(self, endpoint, headers):
+        """
+        Re-sync the local bucket with Twitter's rate-limit response headers.
+        
+        When the remaining budget is exhausted, refilling is postponed until
+        the window resets.
+        
+        Args:
+            endpoint (str): Rate-limit bucket name
+            headers (Mapping): Response headers from the Twitter API
+        """
+        try:
+            remaining = int(headers['x-rate-limit-remaining'])
+            reset = int(headers['x-rate-limit-reset'])
+        except (KeyError, TypeError, ValueError):
+            return
 
+        with self._bucket_lock:
+            updated_at = time.monotonic()
+            if remaining <= 0:
+                updated_at += max(0, reset - time.time())
+            self._bucket[endpoint] = (min(remaining, self.RATE_LIMIT_CAPACITY), updated_at)
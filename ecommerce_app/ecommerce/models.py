@@ -3,7 +3,10 @@ Ecommerce models for Store, Product, and Review.
 """
 from django.db import models
 from django.contrib.auth.models import User
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.validators import MinValueValidator
+
+# Shared validator instances, built once at import time
+_NON_NEGATIVE = MinValueValidator(0)
 
 
 class Store(models.Model):
@@ -45,6 +48,9 @@ class Store(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Store'
         verbose_name_plural = 'Stores'
+        indexes = [
+            models.Index(fields=['vendor', '-created_at'], name='store_vendor_created_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -78,7 +84,7 @@ class Product(models.Model):
     price = models.DecimalField(
         max_digits=10,
         decimal_places=2,
-        validators=[MinValueValidator(0)],
+        validators=[_NON_NEGATIVE],
         help_text="Product price"
     )
     image = models.ImageField(
@@ -96,6 +102,15 @@ class Product(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Product'
         verbose_name_plural = 'Products'
+        indexes = [
+            models.Index(fields=['store', '-created_at'], name='product_store_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(price__gte=0),
+                name='product_price_nonneg'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.store.name}"
@@ -112,13 +127,12 @@ class Review(models.Model):
         comment: Review comment text
         created_at: Timestamp when review was created
     """
-    RATING_CHOICES = [
-        (1, '1 - Poor'),
-        (2, '2 - Fair'),
-        (3, '3 - Good'),
-        (4, '4 - Very Good'),
-        (5, '5 - Excellent'),
-    ]
+    class Rating(models.IntegerChoices):
+        POOR = 1, '1 - Poor'
+        FAIR = 2, '2 - Fair'
+        GOOD = 3, '3 - Good'
+        VERY_GOOD = 4, '4 - Very Good'
+        EXCELLENT = 5, '5 - Excellent'
 
     product = models.ForeignKey(
         Product,
@@ -132,9 +146,8 @@ class Review(models.Model):
         related_name='reviews',
         help_text="The user who wrote the review"
     )
-    rating = models.IntegerField(
-        choices=RATING_CHOICES,
-        validators=[MinValueValidator(1), MaxValueValidator(5)],
+    rating = models.PositiveSmallIntegerField(
+        choices=Rating.choices,
         help_text="Rating from 1 to 5"
     )
     comment = models.TextField(
@@ -150,6 +163,16 @@ class Review(models.Model):
         verbose_name = 'Review'
         verbose_name_plural = 'Reviews'
         unique_together = ['product', 'user']  # One review per user per product
+        indexes = [
+            models.Index(fields=['product', '-created_at'], name='review_product_created_idx'),
+            models.Index(fields=['user', '-created_at'], name='review_user_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=1) & models.Q(rating__lte=5),
+                name='review_rating_1_5'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.product.name} - {self.rating}/5"
@@ -0,0 +1,53 @@
+"""
+Paginators for large ecommerce tables.
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination
+
+
+class LargeTablePaginator(Paginator):
+    """
+    Paginator that avoids COUNT(*) on large, unfiltered PostgreSQL tables.
+
+    The planner's row estimate from pg_class is used once it exceeds
+    ESTIMATE_THRESHOLD. Filtered querysets, small tables and other database
+    backends fall back to the exact count.
+    """
+    ESTIMATE_THRESHOLD = 100000
+
+    @cached_property
+    def count(self):
+        """
+        Return the (possibly estimated) number of objects.
+
+        Returns:
+            int: Total number of objects across all pages
+        """
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            connection = connections[self.object_list.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples FROM pg_class WHERE relname = %s",
+                        [self.object_list.model._meta.db_table]
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] > self.ESTIMATE_THRESHOLD:
+                    return int(row[0])
+        return super().count
+
+
+class CatalogCursorPagination(CursorPagination):
+    """
+    Keyset pagination for API list endpoints.
+
+    Pages continue from the last row seen (WHERE created_at < ?) instead of
+    an OFFSET, so every page costs the same however deep the client reads.
+    The ordering matches the models' default and the listing indexes.
+    """
+    ordering = '-created_at'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
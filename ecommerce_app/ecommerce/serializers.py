@@ -5,6 +5,15 @@ from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Store, Product, Review
 
+# Validation error messages
+STORE_NAME_EMPTY = "Store name cannot be empty"
+STORE_NAME_TOO_SHORT = "Store name must be at least 3 characters long"
+STORE_DESCRIPTION_EMPTY = "Store description cannot be empty"
+PRODUCT_NAME_EMPTY = "Product name cannot be empty"
+PRODUCT_NAME_TOO_SHORT = "Product name must be at least 3 characters long"
+PRODUCT_DESCRIPTION_EMPTY = "Product description cannot be empty"
+REVIEW_COMMENT_EMPTY = "Review comment cannot be empty"
+
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -16,6 +25,76 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+def get_expanded_fields(request):
+    """
+    Parse the relations requested through the expand query parameter.
+    
+    Args:
+        request: DRF request, or None
+    
+    Returns:
+        set: Names of the fields to render nested
+    """
+    expand = request.query_params.get('expand', '') if request else ''
+    return {name.strip() for name in expand.split(',') if name.strip()}
+
+
+class ExpandableFieldsMixin:
+    """
+    Render related objects as primary keys unless expanded via ?expand=.
+    
+    Subclasses map field names to nested serializer classes in
+    Meta.expandable_fields. Clients request nested objects with a
+    comma-separated list, e.g. ?expand=product,store. Read views pass the
+    parsed set as context['expand'] rather than the request, so file URLs
+    stay relative as in the rest of the GET responses.
+    """
+
+    def get_expanded_fields(self):
+        """
+        Get the relations requested through the expand query parameter.
+        
+        Returns:
+            set: Names of the fields to render nested
+        """
+        if not hasattr(self, '_expanded_fields'):
+            expand = self.context.get('expand')
+            if expand is None:
+                expand = get_expanded_fields(self.context.get('request'))
+            self._expanded_fields = expand
+        return self._expanded_fields
+
+    def expand_representation(self, instance, data):
+        """
+        Replace the primary keys of any requested relations with nested data.
+        
+        Args:
+            instance: Model instance being serialized
+            data: Representation with relations rendered as primary keys
+        
+        Returns:
+            dict: Representation with requested relations nested
+        """
+        expanded = self.get_expanded_fields()
+        for field_name, serializer_class in self.Meta.expandable_fields.items():
+            if field_name in expanded:
+                related = getattr(instance, field_name)
+                data[field_name] = serializer_class(related, context=self.context).data
+        return data
+
+    def to_representation(self, instance):
+        """
+        Serialize the instance, nesting any requested relations.
+        
+        Args:
+            instance: Model instance to serialize
+        
+        Returns:
+            dict: Serialized representation
+        """
+        return self.expand_representation(instance, super().to_representation(instance))
+
+
 class StoreSerializer(serializers.ModelSerializer):
     """
     Serializer for Store model.
@@ -43,11 +122,12 @@ class StoreSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If name is empty or too short
         """
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Store name cannot be empty")
-        if len(value) < 3:
-            raise serializers.ValidationError("Store name must be at least 3 characters long")
-        return value.strip()
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(STORE_NAME_EMPTY)
+        if len(stripped) < 3:
+            raise serializers.ValidationError(STORE_NAME_TOO_SHORT)
+        return stripped
 
     def validate_description(self, value):
         """
@@ -62,9 +142,10 @@ class StoreSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If description is empty
         """
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Store description cannot be empty")
-        return value.strip()
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(STORE_DESCRIPTION_EMPTY)
+        return stripped
 
     def create(self, validated_data):
         """
@@ -81,19 +162,21 @@ class StoreSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Product model.
     
-    Includes nested store information and validates product data.
+    Renders the store as its ID (nested with ?expand=store) and validates
+    product data.
     """
-    store = StoreSerializer(read_only=True)
+    store = serializers.PrimaryKeyRelatedField(read_only=True)
     store_id = serializers.IntegerField(write_only=True)
 
     class Meta:
         model = Product
         fields = ['id', 'store', 'store_id', 'name', 'description', 'price', 'image', 'created_at']
         read_only_fields = ['id', 'created_at']
+        expandable_fields = {'store': StoreSerializer}
 
     def validate_name(self, value):
         """
@@ -108,11 +191,12 @@ class ProductSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If name is empty or too short
         """
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Product name cannot be empty")
-        if len(value) < 3:
-            raise serializers.ValidationError("Product name must be at least 3 characters long")
-        return value.strip()
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(PRODUCT_NAME_EMPTY)
+        if len(stripped) < 3:
+            raise serializers.ValidationError(PRODUCT_NAME_TOO_SHORT)
+        return stripped
 
     def validate_description(self, value):
         """
@@ -127,9 +211,10 @@ class ProductSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If description is empty
         """
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Product description cannot be empty")
-        return value.strip()
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(PRODUCT_DESCRIPTION_EMPTY)
+        return stripped
 
     def validate_price(self, value):
         """
@@ -152,6 +237,10 @@ class ProductSerializer(serializers.ModelSerializer):
         """
         Validate store ID and check ownership.
         
+        Reuses the store passed in the serializer context when it matches,
+        otherwise loads only the columns needed for the ownership check. The
+        store is kept in the context for create/update.
+        
         Args:
             value: Store ID to validate
         
@@ -161,32 +250,65 @@ class ProductSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If store doesn't exist or user doesn't own it
         """
-        try:
-            store = Store.objects.get(id=value)
-            request = self.context.get('request')
-            if request and request.user != store.vendor:
-                raise serializers.ValidationError(
-                    "You can only add products to your own stores"
-                )
-        except Store.DoesNotExist:
-            raise serializers.ValidationError("Store does not exist")
+        store = self.context.get('store')
+        if store is None or store.pk != value:
+            try:
+                store = Store.objects.only('id', 'vendor_id').get(id=value)
+            except Store.DoesNotExist:
+                raise serializers.ValidationError("Store does not exist")
+        request = self.context.get('request')
+        if request and request.user.id != store.vendor_id:
+            raise serializers.ValidationError(
+                "You can only add products to your own stores"
+            )
+        self.context['store'] = store
         return value
 
+    def create(self, validated_data):
+        """
+        Create a new product instance.
+        
+        Args:
+            validated_data: Validated product data
+        
+        Returns:
+            Product: Created product instance
+        """
+        validated_data.pop('store_id', None)
+        validated_data['store'] = self.context['store']
+        return super().create(validated_data)
 
-class ReviewSerializer(serializers.ModelSerializer):
+    def update(self, instance, validated_data):
+        """
+        Update an existing product instance.
+        
+        Args:
+            instance: Product instance to update
+            validated_data: Validated product data
+        
+        Returns:
+            Product: Updated product instance
+        """
+        if validated_data.pop('store_id', None) is not None:
+            validated_data['store'] = self.context['store']
+        return super().update(instance, validated_data)
+
+
+class ReviewSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Review model.
     
-    Includes nested user and product information.
+    Renders the user and product as IDs (nested with ?expand=user,product).
     """
-    user = UserSerializer(read_only=True)
-    product = ProductSerializer(read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    product = serializers.PrimaryKeyRelatedField(read_only=True)
     product_id = serializers.IntegerField(write_only=True, required=False)
 
     class Meta:
         model = Review
         fields = ['id', 'product', 'product_id', 'user', 'rating', 'comment', 'created_at']
         read_only_fields = ['id', 'user', 'created_at']
+        expandable_fields = {'product': ProductSerializer, 'user': UserSerializer}
 
     def validate_rating(self, value):
         """
@@ -218,9 +340,10 @@ class ReviewSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If comment is empty
         """
-        if not value or len(value.strip()) == 0:
-            raise serializers.ValidationError("Review comment cannot be empty")
-        return value.strip()
+        stripped = value.strip() if value else ''
+        if not stripped:
+            raise serializers.ValidationError(REVIEW_COMMENT_EMPTY)
+        return stripped
 
     def create(self, validated_data):
         """
@@ -236,3 +359,219 @@ class ReviewSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+# ==================== READ-ONLY SERIALIZERS ====================
+
+def _user_representation(user):
+    """
+    Build the UserSerializer representation of a user.
+    
+    Args:
+        user: User instance
+    
+    Returns:
+        dict: Serialized user
+    """
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+    }
+
+
+class StoreReadSerializer(serializers.Serializer):
+    """
+    Read-only serializer for Store list and detail responses.
+    
+    Builds the same output as StoreSerializer directly, skipping
+    ModelSerializer field introspection for every serialized store.
+    """
+    id = serializers.IntegerField(read_only=True)
+    vendor = UserSerializer(read_only=True)
+    name = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    logo = serializers.ImageField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    def to_representation(self, instance):
+        """
+        Serialize a store.
+        
+        Args:
+            instance: Store instance
+        
+        Returns:
+            dict: Serialized store
+        """
+        fields = self.fields
+        return {
+            'id': instance.id,
+            'vendor': _user_representation(instance.vendor),
+            'name': instance.name,
+            'description': instance.description,
+            'logo': fields['logo'].to_representation(instance.logo),
+            'created_at': fields['created_at'].to_representation(instance.created_at),
+        }
+
+
+class ProductReadSerializer(ExpandableFieldsMixin, serializers.Serializer):
+    """
+    Read-only serializer for Product list and detail responses.
+    
+    Builds the same output as ProductSerializer directly, including
+    ?expand=store support.
+    """
+    id = serializers.IntegerField(read_only=True)
+    store = serializers.PrimaryKeyRelatedField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    image = serializers.ImageField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        expandable_fields = {'store': StoreReadSerializer}
+
+    def to_representation(self, instance):
+        """
+        Serialize a product.
+        
+        Args:
+            instance: Product instance
+        
+        Returns:
+            dict: Serialized product
+        """
+        fields = self.fields
+        return self.expand_representation(instance, {
+            'id': instance.id,
+            'store': instance.store_id,
+            'name': instance.name,
+            'description': instance.description,
+            'price': fields['price'].to_representation(instance.price),
+            'image': fields['image'].to_representation(instance.image),
+            'created_at': fields['created_at'].to_representation(instance.created_at),
+        })
+
+
+class ReviewReadSerializer(ExpandableFieldsMixin, serializers.Serializer):
+    """
+    Read-only serializer for Review list responses.
+    
+    Builds the same output as ReviewSerializer directly, including
+    ?expand=product,user support.
+    """
+    id = serializers.IntegerField(read_only=True)
+    product = serializers.PrimaryKeyRelatedField(read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    rating = serializers.IntegerField(read_only=True)
+    comment = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        expandable_fields = {'product': ProductReadSerializer, 'user': UserSerializer}
+
+    def to_representation(self, instance):
+        """
+        Serialize a review.
+        
+        Args:
+            instance: Review instance
+        
+        Returns:
+            dict: Serialized review
+        """
+        return self.expand_representation(instance, {
+            'id': instance.id,
+            'product': instance.product_id,
+            'user': instance.user_id,
+            'rating': instance.rating,
+            'comment': instance.comment,
+            'created_at': self.fields['created_at'].to_representation(instance.created_at),
+        })
+
+
+# ==================== VALUES-BASED LIST RENDERING ====================
+# Public list endpoints read plain .values() rows instead of model instances.
+# The output matches StoreReadSerializer/ProductReadSerializer.
+
+STORE_LIST_FIELDS = (
+    'id', 'name', 'description', 'logo', 'created_at', 'vendor_id',
+    'vendor__username', 'vendor__email', 'vendor__first_name', 'vendor__last_name',
+)
+PRODUCT_LIST_FIELDS = ('id', 'store_id', 'name', 'description', 'price', 'image', 'created_at')
+REVIEW_LIST_FIELDS = ('id', 'product_id', 'user_id', 'rating', 'comment', 'created_at')
+
+_datetime_field = serializers.DateTimeField()
+_price_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+def _file_url(model, field_name, name):
+    """
+    Build the URL of a stored file the way DRF's FileField does.
+    
+    Args:
+        model: Model class declaring the file field
+        field_name (str): Name of the file field
+        name (str): Stored file name, possibly empty
+    
+    Returns:
+        str: File URL, or None if no file is set
+    """
+    if not name:
+        return None
+    return model._meta.get_field(field_name).storage.url(name)
+
+
+def store_list_data(rows):
+    """
+    Serialize stores for list responses from .values() rows.
+    
+    Args:
+        rows: Store rows from .values(*STORE_LIST_FIELDS)
+    
+    Returns:
+        list: Serialized stores
+    """
+    return [
+        {
+            'id': row['id'],
+            'vendor': {
+                'id': row['vendor_id'],
+                'username': row['vendor__username'],
+                'email': row['vendor__email'],
+                'first_name': row['vendor__first_name'],
+                'last_name': row['vendor__last_name'],
+            },
+            'name': row['name'],
+            'description': row['description'],
+            'logo': _file_url(Store, 'logo', row['logo']),
+            'created_at': _datetime_field.to_representation(row['created_at']),
+        }
+        for row in rows
+    ]
+
+
+def product_list_data(rows):
+    """
+    Serialize products for list responses from .values() rows.
+    
+    Args:
+        rows: Product rows from .values(*PRODUCT_LIST_FIELDS)
+    
+    Returns:
+        list: Serialized products
+    """
+    return [
+        {
+            'id': row['id'],
+            'store': row['store_id'],
+            'name': row['name'],
+            'description': row['description'],
+            'price': _price_field.to_representation(row['price']),
+            'image': _file_url(Product, 'image', row['image']),
+            'created_at': _datetime_field.to_representation(row['created_at']),
+        }
+        for row in rows
+    ]
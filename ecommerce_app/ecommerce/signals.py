@@ -0,0 +1,27 @@
+"""
+Signal receivers for the ecommerce app.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from .cache import bump_catalog_version
+from .models import Store, Product
+
+
+def invalidate_catalog(sender, using=None, update_fields=None, **kwargs):
+    """
+    Invalidate cached catalog responses once the change is committed.
+    
+    Bumping before the commit would let a concurrent request cache the
+    old rows under the new version.
+    """
+    if sender is User and update_fields is not None and set(update_fields) == {'last_login'}:
+        # Logins only touch last_login, which no catalog response renders
+        return
+    transaction.on_commit(bump_catalog_version, using=using)
+
+
+# Stores embed their vendor, so vendor changes invalidate the catalog too
+for model in (Store, Product, User):
+    post_save.connect(invalidate_catalog, sender=model, dispatch_uid=f'catalog-save-{model.__name__}')
+    post_delete.connect(invalidate_catalog, sender=model, dispatch_uid=f'catalog-delete-{model.__name__}')
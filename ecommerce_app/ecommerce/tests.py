@@ -1,43 +1,178 @@
 """
 Test cases for ecommerce API endpoints.
 """
-from django.test import TestCase
+import base64
+import json
+import queue
+import threading
+import time
+import warnings
+import httpx
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from unittest.mock import patch, MagicMock
+from .authentication import CachedBasicAuthentication
+from .cache import get_catalog_version
+from .functions.tweet import Tweet
 from .models import Store, Product, Review
+from .serializers import (
+    StoreSerializer, ProductSerializer, ReviewSerializer,
+    StoreReadSerializer, ProductReadSerializer, ReviewReadSerializer,
+    STORE_LIST_FIELDS, PRODUCT_LIST_FIELDS, store_list_data, product_list_data,
+)
 
 
 class StoreAPITestCase(TestCase):
     """Test cases for Store API endpoints."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
+        cls.user = User.objects.create_user(
             username='vendor1',
             password='testpass123',
             email='vendor1@test.com'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='vendor2',
             password='testpass123',
             email='vendor2@test.com'
         )
-        self.store = Store.objects.create(
-            vendor=self.user,
+        cls.store = Store.objects.create(
+            vendor=cls.user,
             name='Test Store',
             description='A test store description'
         )
     
+    def setUp(self):
+        """Set up the API client and start from an empty cache."""
+        self.client = APIClient()
+        cache.clear()
+    
     def test_list_stores_public(self):
         """Test listing stores (public endpoint)."""
         url = reverse('ecommerce:stores-list-create')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_unexpected_error_reaches_django(self):
+        """Test non-API exceptions are left to Django's 500 handling."""
+        url = reverse('ecommerce:stores-list-create')
+        with patch('ecommerce.views.get_cached_catalog_data', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.client.get(url)
+    
+    def test_list_stores_query_count(self):
+        """Test listing stores does not query the vendor per store."""
+        Store.objects.create(
+            vendor=self.other_user,
+            name='Other Store',
+            description='Another test store'
+        )
+        url = reverse('ecommerce:stores-list-create')
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_list_stores_cursor_pagination(self):
+        """Test the store list is paged with a cursor, newest first."""
+        other = Store.objects.create(
+            vendor=self.other_user,
+            name='Other Store',
+            description='Another test store'
+        )
+        url = reverse('ecommerce:stores-list-create')
+        response = self.client.get(url, {'page_size': 1})
+        self.assertEqual([s['id'] for s in response.data['results']], [other.id])
+        self.assertIsNone(response.data['previous'])
+        response = self.client.get(response.data['next'])
+        self.assertEqual([s['id'] for s in response.data['results']], [self.store.id])
+        self.assertIsNone(response.data['next'])
+    
+    @override_settings(CATALOG_CACHE_ENABLED=True)
+    def test_list_stores_cached_until_catalog_changes(self):
+        """Test the store list is served from cache until a store changes."""
+        url = reverse('ecommerce:stores-list-create')
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIn('max-age=60', response['Cache-Control'])
+        with self.captureOnCommitCallbacks(execute=True):
+            Store.objects.create(
+                vendor=self.other_user,
+                name='Other Store',
+                description='Another test store'
+            )
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    @override_settings(CATALOG_CACHE_ENABLED=True)
+    def test_list_stores_cache_key_length(self):
+        """Test long query strings still produce Memcached-safe cache keys."""
+        url = reverse('ecommerce:stores-list-create')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            response = self.client.get(url, {'q': 'x' * 300})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_list_stores_uncached_without_shared_cache(self):
+        """Test catalog caching and ETags stay off with a per-process cache."""
+        url = reverse('ecommerce:stores-list-create')
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertNotIn('ETag', response)
+    
+    def test_catalog_version_bumped_on_commit(self):
+        """Test the catalog is invalidated only once a change commits."""
+        version = get_catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Store.objects.create(
+                vendor=self.other_user,
+                name='Other Store',
+                description='Another test store'
+            )
+            self.assertEqual(get_catalog_version(), version)
+        self.assertNotEqual(get_catalog_version(), version)
+    
+    def test_login_does_not_invalidate_catalog(self):
+        """Test saving only last_login leaves the catalog cache alone."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.save(update_fields=['last_login'])
+        self.assertEqual(callbacks, [])
+    
+    def test_list_stores_skips_authentication(self):
+        """Test public GETs do not verify Basic credentials."""
+        url = reverse('ecommerce:stores-list-create')
+        credentials = base64.b64encode(b'vendor1:wrongpass').decode()
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Basic {credentials}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    @override_settings(CATALOG_CACHE_ENABLED=True)
+    def test_list_stores_not_modified(self):
+        """Test a matching If-None-Match header returns 304 Not Modified."""
+        url = reverse('ecommerce:stores-list-create')
+        response = self.client.get(url)
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    @override_settings(CATALOG_CACHE_ENABLED=True)
+    def test_create_store_ignores_etag_preconditions(self):
+        """Test catalog ETag preconditions do not apply to creates."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('ecommerce:stores-list-create')
+        data = {'name': 'New Store', 'description': 'A new store'}
+        with patch('ecommerce.views.Tweet'):
+            response = self.client.post(url, data, format='json', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
     
     def test_create_store_authenticated(self):
         """Test creating a store (authenticated)."""
@@ -50,9 +185,11 @@ class StoreAPITestCase(TestCase):
         with patch('ecommerce.views.Tweet') as mock_tweet:
             mock_instance = MagicMock()
             mock_tweet.return_value = mock_instance
-            response = self.client.post(url, data, format='json')
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertEqual(Store.objects.count(), 2)
+            mock_instance.make_tweet.assert_called_once()
     
     def test_create_store_unauthenticated(self):
         """Test creating a store without authentication."""
@@ -63,6 +200,15 @@ class StoreAPITestCase(TestCase):
         }
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json(), {'error': 'Authentication required'})
+        self.assertIn('WWW-Authenticate', response)
+    
+    def test_create_store_unauthenticated_xml(self):
+        """Test error responses still follow XML content negotiation."""
+        url = reverse('ecommerce:stores-list-create')
+        response = self.client.post(url, {'name': 'New Store'}, format='json', HTTP_ACCEPT='application/xml')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('<error>Authentication required</error>', response.content.decode())
     
     def test_get_store_detail(self):
         """Test getting store details (public)."""
@@ -88,6 +234,7 @@ class StoreAPITestCase(TestCase):
         data = {'name': 'Hacked Store Name'}
         response = self.client.put(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.json(), {'error': 'You do not have permission to update this store'})
     
     def test_delete_store_owner(self):
         """Test deleting store by owner."""
@@ -103,40 +250,83 @@ class StoreAPITestCase(TestCase):
         url = reverse('ecommerce:store-detail', kwargs={'store_id': self.store.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_delete_store_not_found(self):
+        """Test deleting a store that does not exist."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('ecommerce:store-detail', kwargs={'store_id': self.store.id + 1})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {'error': 'Store not found'})
+        self.assertEqual(Store.objects.count(), 1)
+    
+    def test_get_store_detail_query_count(self):
+        """Test store details load the store and its vendor in one query."""
+        url = reverse('ecommerce:store-detail', kwargs={'store_id': self.store.id})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data['vendor']['id'], self.user.id)
+    
+    def test_store_detail_not_found(self):
+        """Test requesting a store that does not exist."""
+        url = reverse('ecommerce:store-detail', kwargs={'store_id': self.store.id + 1})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {'error': 'Store not found'})
 
 
 class ProductAPITestCase(TestCase):
     """Test cases for Product API endpoints."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
+        cls.user = User.objects.create_user(
             username='vendor1',
             password='testpass123'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='vendor2',
             password='testpass123'
         )
-        self.store = Store.objects.create(
-            vendor=self.user,
+        cls.store = Store.objects.create(
+            vendor=cls.user,
             name='Test Store',
             description='A test store'
         )
-        self.product = Product.objects.create(
-            store=self.store,
+        cls.product = Product.objects.create(
+            store=cls.store,
             name='Test Product',
             description='A test product',
             price=99.99
         )
     
+    def setUp(self):
+        """Set up the API client and start from an empty cache."""
+        self.client = APIClient()
+        cache.clear()
+    
     def test_list_store_products_public(self):
         """Test listing products in a store (public)."""
         url = reverse('ecommerce:store-products', kwargs={'store_id': self.store.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_list_store_products_expand_query_count(self):
+        """Test expanded product listing does not query per product."""
+        for i in range(3):
+            Product.objects.create(
+                store=self.store,
+                name=f'Extra Product {i}',
+                description='Another test product',
+                price=9.99
+            )
+        url = reverse('ecommerce:store-products', kwargs={'store_id': self.store.id})
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'expand': 'store'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 4)
     
     def test_create_product_authenticated(self):
         """Test creating a product (authenticated, owner)."""
@@ -150,9 +340,11 @@ class ProductAPITestCase(TestCase):
         with patch('ecommerce.views.Tweet') as mock_tweet:
             mock_instance = MagicMock()
             mock_tweet.return_value = mock_instance
-            response = self.client.post(url, data, format='json')
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertEqual(Product.objects.count(), 2)
+            mock_instance.make_tweet.assert_called_once()
     
     def test_create_product_non_owner(self):
         """Test creating a product by non-owner."""
@@ -172,6 +364,23 @@ class ProductAPITestCase(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], 'Test Product')
+        self.assertEqual(response.data['store'], self.store.id)
+    
+    def test_get_product_detail_expand_store(self):
+        """Test nesting the store in product details with ?expand=store."""
+        url = reverse('ecommerce:product-detail', kwargs={'product_id': self.product.id})
+        response = self.client.get(url, {'expand': 'store'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['store']['name'], 'Test Store')
+    
+    def test_get_product_detail_relative_file_urls(self):
+        """Test image and nested logo URLs stay relative in GET responses."""
+        Store.objects.filter(id=self.store.id).update(logo='store_logos/test.png')
+        Product.objects.filter(id=self.product.id).update(image='product_images/test.png')
+        url = reverse('ecommerce:product-detail', kwargs={'product_id': self.product.id})
+        response = self.client.get(url, {'expand': 'store'})
+        self.assertEqual(response.data['image'], '/media/product_images/test.png')
+        self.assertEqual(response.data['store']['logo'], '/media/store_logos/test.png')
     
     def test_update_product_owner(self):
         """Test updating product by store owner."""
@@ -195,71 +404,124 @@ class ProductAPITestCase(TestCase):
 class VendorAPITestCase(TestCase):
     """Test cases for Vendor API endpoints."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
+        cls.user = User.objects.create_user(
             username='vendor1',
             password='testpass123'
         )
-        self.store1 = Store.objects.create(
-            vendor=self.user,
+        cls.store1 = Store.objects.create(
+            vendor=cls.user,
             name='Store 1',
             description='First store'
         )
-        self.store2 = Store.objects.create(
-            vendor=self.user,
+        cls.store2 = Store.objects.create(
+            vendor=cls.user,
             name='Store 2',
             description='Second store'
         )
     
+    def setUp(self):
+        """Set up the API client and start from an empty cache."""
+        self.client = APIClient()
+        cache.clear()
+    
     def test_get_vendor_stores(self):
         """Test getting all stores for a vendor (public)."""
         url = reverse('ecommerce:vendor-stores', kwargs={'vendor_id': self.user.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_get_vendor_stores_query_count(self):
+        """Test a vendor with stores is listed without loading the vendor first."""
+        url = reverse('ecommerce:vendor-stores', kwargs={'vendor_id': self.user.id})
+        with self.assertNumQueries(1):
+            self.client.get(url)
+    
+    def test_get_vendor_stores_unknown_vendor(self):
+        """Test listing stores for a vendor that does not exist."""
+        url = reverse('ecommerce:vendor-stores', kwargs={'vendor_id': self.user.id + 100})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
 class ReviewAPITestCase(TestCase):
     """Test cases for Review API endpoints."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.vendor = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
+        cls.vendor = User.objects.create_user(
             username='vendor1',
             password='testpass123'
         )
-        self.customer = User.objects.create_user(
+        cls.customer = User.objects.create_user(
             username='customer1',
             password='testpass123'
         )
-        self.store = Store.objects.create(
-            vendor=self.vendor,
+        cls.store = Store.objects.create(
+            vendor=cls.vendor,
             name='Test Store',
             description='A test store'
         )
-        self.product = Product.objects.create(
-            store=self.store,
+        cls.product = Product.objects.create(
+            store=cls.store,
             name='Test Product',
             description='A test product',
             price=99.99
         )
-        self.review = Review.objects.create(
-            product=self.product,
-            user=self.customer,
+        cls.review = Review.objects.create(
+            product=cls.product,
+            user=cls.customer,
             rating=5,
             comment='Great product!'
         )
     
+    def setUp(self):
+        """Set up the API client and start from an empty cache."""
+        self.client = APIClient()
+        cache.clear()
+    
     def test_get_vendor_store_reviews(self):
         """Test getting reviews for vendor's store (authenticated, owner)."""
         self.client.force_authenticate(user=self.vendor)
         url = reverse('ecommerce:store-reviews', kwargs={'store_id': self.store.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_get_vendor_store_reviews_query_count(self):
+        """Test store reviews load the store and reviews without deferred lookups."""
+        self.client.force_authenticate(user=self.vendor)
+        url = reverse('ecommerce:store-reviews', kwargs={'store_id': self.store.id})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['comment'], 'Great product!')
+    
+    def test_basic_auth_credentials_verified_once(self):
+        """Test repeated Basic auth requests reuse the verified credentials."""
+        CachedBasicAuthentication._verified.clear()
+        url = reverse('ecommerce:store-reviews', kwargs={'store_id': self.store.id})
+        credentials = base64.b64encode(b'vendor1:testpass123').decode()
+        with patch.object(User, 'check_password', autospec=True, side_effect=User.check_password) as check:
+            for _ in range(2):
+                response = self.client.get(url, HTTP_AUTHORIZATION=f'Basic {credentials}')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(check.call_count, 1)
+    
+    def test_basic_auth_cache_rejects_changed_password(self):
+        """Test cached credentials stop working once the password changes."""
+        CachedBasicAuthentication._verified.clear()
+        url = reverse('ecommerce:store-reviews', kwargs={'store_id': self.store.id})
+        credentials = base64.b64encode(b'vendor1:testpass123').decode()
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Basic {credentials}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.vendor.set_password('newpass456')
+        self.vendor.save()
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Basic {credentials}')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_get_vendor_store_reviews_non_owner(self):
         """Test getting reviews for store by non-owner."""
@@ -267,5 +529,130 @@ class ReviewAPITestCase(TestCase):
         url = reverse('ecommerce:store-reviews', kwargs={'store_id': self.store.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_read_serializers_match_model_serializers(self):
+        """Test read-only serializers produce the same output as the model serializers."""
+        self.assertEqual(StoreReadSerializer(self.store).data, StoreSerializer(self.store).data)
+        self.assertEqual(ProductReadSerializer(self.product).data, ProductSerializer(self.product).data)
+        self.assertEqual(ReviewReadSerializer(self.review).data, ReviewSerializer(self.review).data)
+    
+    def test_list_data_matches_read_serializers(self):
+        """Test values-based list rendering matches the read-only serializers."""
+        self.assertEqual(
+            store_list_data(Store.objects.values(*STORE_LIST_FIELDS)),
+            StoreReadSerializer(Store.objects.all(), many=True).data
+        )
+        self.product.image = 'product_images/test.png'
+        self.product.save()
+        self.assertEqual(
+            product_list_data(Product.objects.values(*PRODUCT_LIST_FIELDS)),
+            ProductReadSerializer(Product.objects.all(), many=True).data
+        )
 
 
+
+TWITTER_TEST_CREDENTIALS = {
+    'TWITTER_CONSUMER_KEY': 'consumer-key',
+    'TWITTER_CONSUMER_SECRET': 'consumer-secret',
+    'TWITTER_ACCESS_TOKEN': 'access-token',
+    'TWITTER_ACCESS_TOKEN_SECRET': 'access-token-secret',
+}
+
+
+@override_settings(
+    TWITTER_CONSUMER_KEY='', TWITTER_CONSUMER_SECRET='',
+    TWITTER_ACCESS_TOKEN='', TWITTER_ACCESS_TOKEN_SECRET=''
+)
+class TweetTestCase(SimpleTestCase):
+    """Test cases for the Tweet singleton."""
+    
+    def setUp(self):
+        """Start every test from a fresh singleton."""
+        Tweet._instance = None
+    
+    def tearDown(self):
+        """Drop the singleton so later tests build their own."""
+        if Tweet._instance is not None and Tweet._instance.client is not None:
+            Tweet._instance.client.close()
+        Tweet._instance = None
+    
+    def test_make_tweet_posts_json_body(self):
+        """Test queued tweets are posted with their JSON body and OAuth1 header."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={'data': {'id': '1'}})
+
+        with override_settings(**TWITTER_TEST_CREDENTIALS), \
+                patch('ecommerce.functions.tweet.httpx.HTTPTransport', return_value=httpx.MockTransport(handler)):
+            tweet = Tweet()
+        self.assertTrue(tweet.make_tweet({'text': 'hi'}))
+        tweet._queue.join()
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(json.loads(requests[0].content), {'text': 'hi'})
+        self.assertTrue(requests[0].headers['Authorization'].startswith('OAuth '))
+    
+    def test_concurrent_first_use_waits_for_initialization(self):
+        """Test a caller arriving mid-initialization still gets a working instance."""
+        started = threading.Event()
+        authenticate = Tweet.authenticate
+
+        def slow_authenticate(tweet):
+            started.set()
+            time.sleep(0.05)
+            return authenticate(tweet)
+
+        results = []
+
+        def make_tweet():
+            results.append(Tweet().make_tweet({'text': 'hi'}))
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(201, json={}))
+        with override_settings(**TWITTER_TEST_CREDENTIALS), \
+                patch('ecommerce.functions.tweet.httpx.HTTPTransport', return_value=transport), \
+                patch.object(Tweet, 'authenticate', slow_authenticate):
+            first = threading.Thread(target=make_tweet)
+            first.start()
+            started.wait(1)
+            make_tweet()
+            first.join()
+        self.assertEqual(results, [True, True])
+        Tweet._instance._queue.join()
+    
+    def test_make_tweet_unauthenticated(self):
+        """Test tweets are skipped without credentials."""
+        self.assertFalse(Tweet().make_tweet({'text': 'hi'}))
+    
+    def test_make_tweet_queue_full(self):
+        """Test tweets are dropped once the queue is full."""
+        tweet = Tweet()
+        tweet.client = MagicMock()
+        tweet._worker = MagicMock()
+        tweet._queue = queue.Queue(maxsize=1)
+        self.assertTrue(tweet.make_tweet({'text': 'first'}))
+        self.assertFalse(tweet.make_tweet({'text': 'second'}))
+    
+    def test_acquire_exhausts_bucket(self):
+        """Test the rate-limit bucket allows RATE_LIMIT_CAPACITY calls per window."""
+        tweet = Tweet()
+        with patch('ecommerce.functions.tweet.time.monotonic', return_value=1000.0):
+            for _ in range(Tweet.RATE_LIMIT_CAPACITY):
+                self.assertTrue(tweet._acquire('tweets'))
+            self.assertFalse(tweet._acquire('tweets'))
+        refill = Tweet.RATE_LIMIT_WINDOW / Tweet.RATE_LIMIT_CAPACITY
+        with patch('ecommerce.functions.tweet.time.monotonic', return_value=1000.0 + refill):
+            self.assertTrue(tweet._acquire('tweets'))
+    
+    def test_sync_rate_limit_waits_for_reset(self):
+        """Test an exhausted remote budget blocks the bucket until the window resets."""
+        tweet = Tweet()
+        tweet._sync_rate_limit('tweets', {
+            'x-rate-limit-remaining': '0',
+            'x-rate-limit-reset': str(int(time.time()) + 60),
+        })
+        self.assertFalse(tweet._acquire('tweets'))
+        tweet._sync_rate_limit('tweets', {'x-rate-limit-remaining': '2', 'x-rate-limit-reset': '0'})
+        self.assertTrue(tweet._acquire('tweets'))
+        self.assertTrue(tweet._acquire('tweets'))
+        self.assertFalse(tweet._acquire('tweets'))
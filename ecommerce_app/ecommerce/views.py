@@ -1,24 +1,81 @@
 """
 API views for ecommerce application with RESTful endpoints.
 """
-import logging
+import json
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import BasicAuthentication
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
-from django.shortcuts import get_object_or_404
+from rest_framework.exceptions import NotAuthenticated, NotFound
 from django.contrib.auth.models import User
-from django.http import JsonResponse
-from .models import Store, Product, Review
-from .serializers import StoreSerializer, ProductSerializer, ReviewSerializer
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+from .authentication import CachedBasicAuthentication, WriteBasicAuthentication
+from .cache import add_catalog_cache_headers, catalog_etag, get_cached_catalog_data
+from .decorators import require_product_owner, require_store_owner
+from .models import Store, Review
+from .paginators import CatalogCursorPagination
+from .serializers import (
+    StoreSerializer, ProductSerializer,
+    StoreReadSerializer, ProductReadSerializer, ReviewReadSerializer,
+    STORE_LIST_FIELDS, PRODUCT_LIST_FIELDS, REVIEW_LIST_FIELDS,
+    get_expanded_fields, store_list_data, product_list_data,
+)
 from .functions.tweet import Tweet
 
-logger = logging.getLogger(__name__)
-
 
 # ==================== ROOT VIEW ====================
 
+API_INFO = {
+    'name': 'Django eCommerce RESTful API',
+    'version': '1.0.0',
+    'description': 'A complete Django eCommerce RESTful API with Twitter/X integration',
+    'base_url': '/api/',
+    'endpoints': {
+        'public': {
+            'stores': {
+                'list': 'GET /api/stores/',
+                'detail': 'GET /api/stores/{id}/',
+                'products': 'GET /api/stores/{store_id}/products/',
+            },
+            'products': {
+                'detail': 'GET /api/products/{id}/',
+            },
+            'vendors': {
+                'stores': 'GET /api/vendors/{vendor_id}/stores/',
+            },
+        },
+        'authenticated': {
+            'stores': {
+                'create': 'POST /api/stores/',
+                'update': 'PUT /api/stores/{id}/',
+                'delete': 'DELETE /api/stores/{id}/',
+                'reviews': 'GET /api/stores/{store_id}/reviews/',
+            },
+            'products': {
+                'create': 'POST /api/stores/{store_id}/products/',
+                'update': 'PUT /api/products/{id}/',
+                'delete': 'DELETE /api/products/{id}/',
+            },
+        },
+    },
+    'authentication': {
+        'type': 'Basic Authentication',
+        'header': 'Authorization: Basic <base64(username:password)>',
+    },
+    'formats': ['JSON', 'XML'],
+    'documentation': {
+        'readme': 'See README.md for full documentation',
+        'postman': 'Import postman_collection.json for API examples',
+    },
+}
+
+# The API description never changes, so it is rendered once at import time
+_API_ROOT_BYTES = json.dumps(API_INFO, indent=2).encode()
+
+
 def api_root(request):
     """
     Root API endpoint that provides API information and available endpoints.
@@ -26,50 +83,76 @@ def api_root(request):
     GET /
     No authentication required
     """
-    api_info = {
-        'name': 'Django eCommerce RESTful API',
-        'version': '1.0.0',
-        'description': 'A complete Django eCommerce RESTful API with Twitter/X integration',
-        'base_url': '/api/',
-        'endpoints': {
-            'public': {
-                'stores': {
-                    'list': 'GET /api/stores/',
-                    'detail': 'GET /api/stores/{id}/',
-                    'products': 'GET /api/stores/{store_id}/products/',
-                },
-                'products': {
-                    'detail': 'GET /api/products/{id}/',
-                },
-                'vendors': {
-                    'stores': 'GET /api/vendors/{vendor_id}/stores/',
-                },
-            },
-            'authenticated': {
-                'stores': {
-                    'create': 'POST /api/stores/',
-                    'update': 'PUT /api/stores/{id}/',
-                    'delete': 'DELETE /api/stores/{id}/',
-                    'reviews': 'GET /api/stores/{store_id}/reviews/',
-                },
-                'products': {
-                    'create': 'POST /api/stores/{store_id}/products/',
-                    'update': 'PUT /api/products/{id}/',
-                    'delete': 'DELETE /api/products/{id}/',
-                },
-            },
-        },
-        'authentication': {
-            'type': 'Basic Authentication',
-            'header': 'Authorization: Basic <base64(username:password)>',
-        },
-        'formats': ['JSON', 'XML'],
-        'documentation': {
-            'readme': 'See README.md for full documentation',
-            'postman': 'Import postman_collection.json for API examples',
-        },
-    }
-    return JsonResponse(api_info, json_dumps_params={'indent': 2})
+    response = HttpResponse(_API_ROOT_BYTES, content_type='application/json')
+    patch_cache_control(response, public=True, max_age=60 * 60 * 24, immutable=True)
+    return response
+
+
+# ==================== TWEETS ====================
+
+def _truncate(text, width):
+    """
+    Cut text to width characters, marking the cut with an ellipsis.
+    
+    Args:
+        text (str): Text to shorten
+        width (int): Maximum number of characters kept
+    
+    Returns:
+        str: The text, or its first width characters followed by '...'
+    """
+    return text if len(text) <= width else f"{text[:width]}..."
+
+
+def _tweet_new_store(store):
+    """
+    Queue the announcement tweet for a newly created store.
+    
+    Runs after the creating transaction commits, off the response path.
+    """
+    tweet_text = (
+        f"🏪 New Store Alert!\n\n"
+        f"📛 {store.name}\n\n"
+        f"📝 {_truncate(store.description, 200)}\n\n"
+        f"#eCommerce #NewStore"
+    )
+    Tweet().make_tweet({'text': tweet_text})
+
+
+def _tweet_new_product(store, product):
+    """
+    Queue the announcement tweet for a newly created product.
+    
+    Runs after the creating transaction commits, off the response path.
+    """
+    tweet_text = (
+        f"🛍️ New Product Alert!\n\n"
+        f"🏪 Store: {store.name}\n"
+        f"📦 Product: {product.name}\n"
+        f"💰 Price: ${product.price}\n\n"
+        f"📝 {_truncate(product.description, 150)}\n\n"
+        f"#eCommerce #NewProduct #Shopping"
+    )
+    Tweet().make_tweet({'text': tweet_text})
+
+
+# ==================== PAGINATION ====================
+
+def _paginated(queryset, request, render):
+    """
+    Render one cursor page of a list endpoint.
+    
+    Args:
+        queryset: Queryset or .values() queryset to paginate
+        request: Incoming request carrying the cursor
+        render (callable): Turns the page's rows into serialized data
+    
+    Returns:
+        dict: next/previous links and the page's results
+    """
+    paginator = CatalogCursorPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    return paginator.get_paginated_response(render(page)).data
 
 
 # ==================== VENDOR ENDPOINTS (Authenticated) ====================
@@ -77,261 +160,139 @@ def api_root(request):
 
 
 @api_view(['GET', 'PUT', 'DELETE'])
-@authentication_classes([BasicAuthentication])
+@authentication_classes([WriteBasicAuthentication])
 @permission_classes([AllowAny])
-def store_detail(request, store_id):
+@require_store_owner({'PUT': 'update', 'DELETE': 'delete'})
+def store_detail(request, store):
     """
     Get, update, or delete a store.
     
     GET /api/stores/{id}/ - Get store details (Public)
     PUT /api/stores/{id}/ - Update store (Authenticated, must own)
     DELETE /api/stores/{id}/ - Delete store (Authenticated, must own)
+    
+    DELETE is carried out by require_store_owner in one owner-filtered query.
     """
-    try:
-        store = get_object_or_404(Store, id=store_id)
-        
-        if request.method == 'GET':
-            # Public endpoint - no auth required
-            serializer = StoreSerializer(store)
+    if request.method == 'GET':
+        # Public endpoint - no auth required
+        serializer = StoreReadSerializer(store)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    else:  # PUT
+        serializer = StoreSerializer(store, data=request.data, partial=True, context={'request': request})
+        if serializer.is_valid():
+            serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
-        
-        elif request.method == 'PUT':
-            # Check authentication
-            if not request.user.is_authenticated:
-                return Response(
-                    {'error': 'Authentication required'},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            # Check ownership
-            if store.vendor != request.user:
-                return Response(
-                    {'error': 'You do not have permission to update this store'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            serializer = StoreSerializer(store, data=request.data, partial=True, context={'request': request})
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
-        else:  # DELETE
-            # Check authentication
-            if not request.user.is_authenticated:
-                return Response(
-                    {'error': 'Authentication required'},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            # Check ownership
-            if store.vendor != request.user:
-                return Response(
-                    {'error': 'You do not have permission to delete this store'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            store.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-            
-    except Store.DoesNotExist:
-        return Response(
-            {'error': 'Store not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    except Exception as e:
-        logger.error(f"Error with store operation: {str(e)}")
-        return Response(
-            {'error': 'Operation failed'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 
 
+@condition(etag_func=catalog_etag)
 @api_view(['GET', 'POST'])
-@authentication_classes([BasicAuthentication])
+@authentication_classes([WriteBasicAuthentication])
 @permission_classes([AllowAny])
-def store_products(request, store_id):
+@require_store_owner({'POST': 'add products to'}, fields=('id', 'vendor_id', 'name'))
+def store_products(request, store):
     """
     Get all products in a store (GET) or add a product to a store (POST).
     
     GET /api/stores/{store_id}/products/ - List all products (Public)
     POST /api/stores/{store_id}/products/ - Add product (Authenticated, must own store)
     """
-    try:
-        store = get_object_or_404(Store, id=store_id)
-        
-        if request.method == 'GET':
-            # Public endpoint
+    if request.method == 'GET':
+        # Public endpoint
+        def build_products():
             products = store.products.all()
-            serializer = ProductSerializer(products, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        
-        else:  # POST
-            # Check authentication
-            if not request.user.is_authenticated:
-                return Response(
-                    {'error': 'Authentication required'},
-                    status=status.HTTP_401_UNAUTHORIZED
+            if request.query_params.get('expand'):
+                return _paginated(
+                    products.select_related('store__vendor'), request,
+                    lambda page: ProductReadSerializer(
+                        page, many=True, context={'expand': get_expanded_fields(request)}
+                    ).data
                 )
-            
-            # Check ownership
-            if store.vendor != request.user:
-                return Response(
-                    {'error': 'You do not have permission to add products to this store'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            # Add store_id to request data
-            data = request.data.copy()
-            data['store_id'] = store_id
-            
-            serializer = ProductSerializer(data=data, context={'request': request})
-            if serializer.is_valid():
+            return _paginated(products.values(*PRODUCT_LIST_FIELDS), request, product_list_data)
+
+        data = get_cached_catalog_data('store-products', request, build_products)
+        return add_catalog_cache_headers(Response(data, status=status.HTTP_200_OK))
+    
+    else:  # POST
+        # Add store_id to request data
+        data = request.data.copy()
+        data['store_id'] = store.id
+        
+        serializer = ProductSerializer(data=data, context={'request': request, 'store': store})
+        if serializer.is_valid():
+            with transaction.atomic():
                 product = serializer.save()
                 
-                # Trigger tweet for new product
-                try:
-                    tweet = Tweet()
-                    tweet_text = (
-                        f"🛍️ New Product Alert!\n\n"
-                        f"🏪 Store: {store.name}\n"
-                        f"📦 Product: {product.name}\n"
-                        f"💰 Price: ${product.price}\n\n"
-                        f"📝 {product.description[:150]}{'...' if len(product.description) > 150 else ''}\n\n"
-                        f"#eCommerce #NewProduct #Shopping"
-                    )
-                    tweet.make_tweet({'text': tweet_text})
-                except Exception as e:
-                    logger.error(f"Failed to post tweet for new product: {str(e)}")
-                
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+                # Tweet about the new product once it is committed; robust
+                # callbacks log failures instead of failing the request
+                transaction.on_commit(lambda: _tweet_new_product(store, product), robust=True)
             
-    except Store.DoesNotExist:
-        return Response(
-            {'error': 'Store not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    except Exception as e:
-        logger.error(f"Error with store products: {str(e)}")
-        return Response(
-            {'error': 'Operation failed'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['GET', 'PUT', 'DELETE'])
-@authentication_classes([BasicAuthentication])
+@authentication_classes([WriteBasicAuthentication])
 @permission_classes([AllowAny])
-def product_detail(request, product_id):
+@require_product_owner({'PUT': 'update', 'DELETE': 'delete'})
+def product_detail(request, product):
     """
     Get, update, or delete a product.
     
     GET /api/products/{id}/ - Get product details (Public)
     PUT /api/products/{id}/ - Update product (Authenticated, must own store)
     DELETE /api/products/{id}/ - Delete product (Authenticated, must own store)
+    
+    DELETE is carried out by require_product_owner in one owner-filtered query.
     """
-    try:
-        product = get_object_or_404(Product, id=product_id)
-        
-        if request.method == 'GET':
-            # Public endpoint
-            serializer = ProductSerializer(product)
+    if request.method == 'GET':
+        # Public endpoint
+        serializer = ProductReadSerializer(product, context={'expand': get_expanded_fields(request)})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    else:  # PUT
+        serializer = ProductSerializer(product, data=request.data, partial=True, context={'request': request})
+        if serializer.is_valid():
+            serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
-        
-        elif request.method == 'PUT':
-            # Check authentication
-            if not request.user.is_authenticated:
-                return Response(
-                    {'error': 'Authentication required'},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            # Check ownership
-            if product.store.vendor != request.user:
-                return Response(
-                    {'error': 'You do not have permission to update this product'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            serializer = ProductSerializer(product, data=request.data, partial=True, context={'request': request})
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
-        else:  # DELETE
-            # Check authentication
-            if not request.user.is_authenticated:
-                return Response(
-                    {'error': 'Authentication required'},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            # Check ownership
-            if product.store.vendor != request.user:
-                return Response(
-                    {'error': 'You do not have permission to delete this product'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            product.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-            
-    except Product.DoesNotExist:
-        return Response(
-            {'error': 'Product not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    except Exception as e:
-        logger.error(f"Error with product operation: {str(e)}")
-        return Response(
-            {'error': 'Operation failed'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 
 
 @api_view(['GET'])
-@authentication_classes([BasicAuthentication])
+@authentication_classes([CachedBasicAuthentication])
 @permission_classes([IsAuthenticated])
-def get_vendor_store_reviews(request, store_id):
+@require_store_owner({'GET': 'view reviews for'}, fields=('id', 'vendor_id'))
+def get_vendor_store_reviews(request, store):
     """
     Get all reviews for a vendor's store (Vendor only, must own the store).
     
     GET /api/stores/{store_id}/reviews/
     Requires: Basic Authentication, Store ownership
     """
-    try:
-        store = get_object_or_404(Store, id=store_id)
-        
-        # Check ownership
-        if store.vendor != request.user:
-            return Response(
-                {'error': 'You do not have permission to view reviews for this store'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        # Get all products in the store
-        products = store.products.all()
-        reviews = Review.objects.filter(product__in=products)
-        serializer = ReviewSerializer(reviews, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except Exception as e:
-        logger.error(f"Error fetching store reviews: {str(e)}")
-        return Response(
-            {'error': 'Failed to fetch reviews'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+    # Get all reviews for products in the store in one joined query
+    reviews = Review.objects.filter(product__store_id=store.id)
+    if get_expanded_fields(request):
+        reviews = reviews.select_related('user', 'product__store__vendor')
+    else:
+        # Unexpanded reviews render IDs only, so skip the joined columns
+        reviews = reviews.only(*REVIEW_LIST_FIELDS)
+    data = _paginated(
+        reviews, request,
+        lambda page: ReviewReadSerializer(page, many=True, context={'expand': get_expanded_fields(request)}).data
+    )
+    return Response(data, status=status.HTTP_200_OK)
 
 
 # ==================== PUBLIC ENDPOINTS (No auth required) ====================
 
+@condition(etag_func=catalog_etag)
 @api_view(['GET', 'POST'])
-@authentication_classes([BasicAuthentication])
+@authentication_classes([WriteBasicAuthentication])
 @permission_classes([AllowAny])
 def stores_list_create(request):
     """
@@ -341,53 +302,32 @@ def stores_list_create(request):
     POST /api/stores/ - Create new store (Authenticated)
     """
     if request.method == 'GET':
-        try:
-            stores = Store.objects.all()
-            serializer = StoreSerializer(stores, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Error listing stores: {str(e)}")
-            return Response(
-                {'error': 'Failed to list stores'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        data = get_cached_catalog_data(
+            'stores', request,
+            lambda: _paginated(Store.objects.values(*STORE_LIST_FIELDS), request, store_list_data)
+        )
+        return add_catalog_cache_headers(Response(data, status=status.HTTP_200_OK))
     else:  # POST
         if not request.user.is_authenticated:
-            return Response(
-                {'error': 'Authentication required'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-        try:
-            serializer = StoreSerializer(data=request.data, context={'request': request})
-            if serializer.is_valid():
+            raise NotAuthenticated('Authentication required')
+        serializer = StoreSerializer(data=request.data, context={'request': request})
+        if serializer.is_valid():
+            with transaction.atomic():
                 store = serializer.save()
                 
-                # Trigger tweet for new store
-                try:
-                    tweet = Tweet()
-                    tweet_text = (
-                        f"🏪 New Store Alert!\n\n"
-                        f"📛 {store.name}\n\n"
-                        f"📝 {store.description[:200]}{'...' if len(store.description) > 200 else ''}\n\n"
-                        f"#eCommerce #NewStore"
-                    )
-                    tweet.make_tweet({'text': tweet_text})
-                except Exception as e:
-                    logger.error(f"Failed to post tweet for new store: {str(e)}")
-                
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            logger.error(f"Error creating store: {str(e)}")
-            return Response(
-                {'error': 'Failed to create store'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+                # Tweet about the new store once it is committed; robust
+                # callbacks log failures instead of failing the request
+                transaction.on_commit(lambda: _tweet_new_store(store), robust=True)
+            
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 
 
+@condition(etag_func=catalog_etag)
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
 def get_vendor_stores(request, vendor_id):
     """
@@ -396,22 +336,18 @@ def get_vendor_stores(request, vendor_id):
     GET /api/vendors/{vendor_id}/stores/
     No authentication required
     """
-    try:
-        vendor = get_object_or_404(User, id=vendor_id)
-        stores = Store.objects.filter(vendor=vendor)
-        serializer = StoreSerializer(stores, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except User.DoesNotExist:
-        return Response(
-            {'error': 'Vendor not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    except Exception as e:
-        logger.error(f"Error fetching vendor stores: {str(e)}")
-        return Response(
-            {'error': 'Failed to fetch vendor stores'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+    def build_stores():
+        stores = Store.objects.filter(vendor_id=vendor_id).values(*STORE_LIST_FIELDS)
+        data = _paginated(stores, request, store_list_data)
+        # Only an empty page needs the vendor looked up
+        if not data['results'] and not User.objects.filter(id=vendor_id).exists():
+            return None
+        return data
+
+    data = get_cached_catalog_data('vendor-stores', request, build_stores)
+    if data is None:
+        raise NotFound('Vendor not found')
+    return add_catalog_cache_headers(Response(data, status=status.HTTP_200_OK))
 
 
 
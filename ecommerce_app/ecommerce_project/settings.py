@@ -2,6 +2,7 @@
 Django settings for ecommerce_project project.
 """
 
+import sys
 from pathlib import Path
 from decouple import config
 
@@ -96,6 +97,44 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Use a fast password hasher for the test suite; PBKDF2 dominates test runtime
+if sys.argv[1:2] == ['test']:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Use a shared backend (Redis/Memcached) in production so every worker sees
+# the same catalog version.
+
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='ecommerce'),
+    }
+}
+
+# Public catalog responses: server-side cache TTL and client Cache-Control
+CATALOG_CACHE_TIMEOUT = config('CATALOG_CACHE_TIMEOUT', default=300, cast=int)
+CATALOG_CACHE_MAX_AGE = 60
+CATALOG_CACHE_STALE_WHILE_REVALIDATE = 300
+
+# Server-side catalog caching and ETags rely on a version shared by every
+# worker; a per-process cache would keep serving stale lists after a write
+# in another process. Set CATALOG_CACHE_ENABLED=True to opt in for a single
+# process (e.g. runserver).
+CATALOG_CACHE_ENABLED = config(
+    'CATALOG_CACHE_ENABLED',
+    default=CACHES['default']['BACKEND'] not in (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.dummy.DummyCache',
+    ),
+    cast=bool
+)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -125,7 +164,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.BasicAuthentication',
+        'ecommerce.authentication.CachedBasicAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -138,6 +177,9 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.JSONParser',
         'rest_framework_xml.parsers.XMLParser',
     ],
+    'EXCEPTION_HANDLER': 'ecommerce.exceptions.api_exception_handler',
+    'DEFAULT_PAGINATION_CLASS': 'ecommerce.paginators.CatalogCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
 # Twitter API Configuration (loaded from environment variables)
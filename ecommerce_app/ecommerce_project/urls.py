@@ -8,9 +8,9 @@ from django.conf.urls.static import static
 from ecommerce.views import api_root
 
 urlpatterns = [
+    path('api/', include('ecommerce.urls')),
     path('', api_root, name='api-root'),
     path('admin/', admin.site.urls),
-    path('api/', include('ecommerce.urls')),
 ]
 
 # Serve media files in development